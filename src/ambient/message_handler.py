@@ -11,7 +11,7 @@ from telegram.ext import ContextTypes
 
 from core.logger import get_logger
 from core.progress.progress import ProcessingStage
-from ambient.session import session_manager
+from ambient.session import get_session_manager
 from ambient.telegram.handler import _edit_with_retry, is_authorized
 from ambient.router import CommandType, ParsedCommand
 
@@ -47,10 +47,10 @@ class MessageHandler:
     def __init__(self, file_path: str, telegram_edit_rate_limit: float = 0.5):
         self.file_path = file_path
         self.telegram_edit_rate_limit = telegram_edit_rate_limit
-        self._allowed_user_id: Optional[str] = None
+        self._allowed_user_id: Optional[int] = None
         self._progress_callbacks: List[callable] = []
     
-    def set_allowed_user(self, user_id: Optional[str]) -> None:
+    def set_allowed_user(self, user_id: Optional[int]) -> None:
         self._allowed_user_id = user_id
     
     def add_progress_callback(self, callback: callable) -> None:
@@ -151,7 +151,7 @@ class MessageHandler:
         _logger.info(f"Intent detected: #code. Processing for chat {chat_id}...")
         
         extra = raw_text[5:].strip()
-        window = session_manager.get_conversation_window(chat_id)
+        window = get_session_manager().get_conversation_window(chat_id)
         
         if not window:
             await update.message.reply_text(
@@ -190,8 +190,8 @@ class MessageHandler:
         
         _logger.info(f"Compressed prompt: {coding_prompt[:100]}...")
         
-        session_manager.advance_window(chat_id)
-        session_manager.add_message(chat_id, "user", raw_text, solo=False)
+        get_session_manager().advance_window(chat_id)
+        get_session_manager().add_message(chat_id, "user", raw_text, solo=False)
         
         preview = coding_prompt[:600] + ("…" if len(coding_prompt) > 600 else "")
         from motor.manager import manager
@@ -250,9 +250,9 @@ class MessageHandler:
         
         _logger.info("Intent detected: Brainstorm (Plain text)")
         
-        session_manager.add_message(chat_id, "user", raw_text, solo=False)
+        get_session_manager().add_message(chat_id, "user", raw_text, solo=False)
         
-        window = session_manager.get_conversation_window(chat_id)
+        window = get_session_manager().get_conversation_window(chat_id)
         
         streaming_msg = await update.message.reply_text("<b>🤔 Thinking...</b>", parse_mode=ParseMode.HTML)
         
@@ -261,7 +261,7 @@ class MessageHandler:
         bubble_start_time = time.time()
         
         assistant = manager.get_default_assistant()
-        extra = session_manager.format_current_context_for_prompt()
+        extra = get_session_manager().format_current_context_for_prompt()
         prompt_val = assistant.format_prompt(window, BRAINSTORM_SYSTEM, extra_context=extra)
         
         cmd = assistant.get_command(prompt_val, agent="plan", format_json=True)
@@ -286,7 +286,7 @@ class MessageHandler:
             nonlocal last_event_type, bubble_start_time, last_tool_name, token_count
             
             while True:
-                if session_manager.is_cancelled(streaming_msg.chat_id):
+                if get_session_manager().is_cancelled(streaming_msg.chat_id):
                     raise asyncio.CancelledError("User requested stop.")
                 
                 line = await stream.readline()
@@ -398,7 +398,7 @@ class MessageHandler:
             await process.wait()
         except (asyncio.CancelledError, Exception) as e:
             process.terminate()
-            session_manager.unmark_cancelled(streaming_msg.chat_id)
+            get_session_manager().unmark_cancelled(streaming_msg.chat_id)
             raise e
         finally:
             timer_task.cancel()
@@ -416,7 +416,7 @@ class MessageHandler:
         
         if "ProviderModelNotFoundError" in error_output or "Model not found" in error_output:
             _logger.error(f"Model not found error detected in brainstorm: {error_output[:200]}")
-            if session_manager.record_empty_response(chat_id):
+            if get_session_manager().record_empty_response(chat_id):
                 await _edit_with_retry(
                     context.bot,
                     chat_id=chat_id,
@@ -425,14 +425,14 @@ class MessageHandler:
                          "Please check your model configuration and try again.",
                     parse_mode=ParseMode.HTML
                 )
-                session_manager.reset_empty_response_counter(chat_id)
+                get_session_manager().reset_empty_response_counter(chat_id)
                 return
         
         response = combined_output.strip()
         
         if not response:
             _logger.warning(f"Empty response from assistant for chat {chat_id}")
-            if session_manager.record_empty_response(chat_id):
+            if get_session_manager().record_empty_response(chat_id):
                 await _edit_with_retry(
                     context.bot,
                     chat_id=chat_id,
@@ -441,10 +441,10 @@ class MessageHandler:
                          "This usually indicates a model/API issue. Please try again later or use a different model.",
                     parse_mode=ParseMode.HTML
                 )
-                session_manager.reset_empty_response_counter(chat_id)
+                get_session_manager().reset_empty_response_counter(chat_id)
                 return
         else:
-            session_manager.reset_empty_response_counter(chat_id)
+            get_session_manager().reset_empty_response_counter(chat_id)
         
         try:
             chunks = split_message_with_code_block(response)
@@ -469,7 +469,7 @@ class MessageHandler:
             parse_mode=ParseMode.MARKDOWN
         )
         
-        session_manager.add_message(chat_id, "assistant", response, solo=False)
+        get_session_manager().add_message(chat_id, "assistant", response, solo=False)
         _logger.info("Finished processing Brainstorm intent.")
     
     async def emit_progress(self, progress_data: Dict[str, Any]) -> None:
@@ -3,7 +3,6 @@ from __future__ import annotations
 import asyncio
 import json
 import time
-from pathlib import Path
 from typing import AsyncIterator, Any, Dict
 
 from fastapi import FastAPI, HTTPException
@@ -14,11 +13,11 @@ from uvicorn import Config, Server
 
 from core.events import ProgressUpdate, SessionID
 from ambient.observability.hub import get_observability_hub
+from ambient.session import get_session_manager
 from core.telemetry import TelemetryEvent, get_event_ledger
 
 OBSERVABILITY_HOST = "0.0.0.0"
 OBSERVABILITY_PORT = 8765
-SESSION_STATE_PATH = Path.home() / ".voice-to-code" / "sessions-state.json"
 SESSION_EVENT_LIMIT = 200
 
 app = FastAPI(
@@ -57,16 +56,6 @@ async def health() -> PlainTextResponse:
     return PlainTextResponse("ok")
 
 
-def _load_session_states() -> Dict[str, Any]:
-    if not SESSION_STATE_PATH.exists():
-        return {}
-    try:
-        with open(SESSION_STATE_PATH, "r", encoding="utf-8") as fp:
-            return json.load(fp)
-    except (json.JSONDecodeError, OSError):
-        return {}
-
-
 def _serialize_telemetry_event(event: TelemetryEvent) -> Dict[str, Any]:
     return {
         "session_id": int(event.session_id),
@@ -79,10 +68,12 @@ def _serialize_telemetry_event(event: TelemetryEvent) -> Dict[str, Any]:
 
 @app.get("/observability/sessions/{session_id}")
 async def session_details(session_id: int) -> JSONResponse:
-    sessions = _load_session_states()
-    state = sessions.get(str(session_id))
-    if not state:
+    # Read through the session manager: the state file holds only headers and
+    # recent changes may still be in the session log.
+    session = get_session_manager().get_session(SessionID(session_id))
+    if session is None:
         raise HTTPException(status_code=404, detail="Session not found")
+    state = session.to_dict()
 
     ledger = get_event_ledger()
     events = ledger.get_events(SessionID(session_id))
@@ -117,13 +117,13 @@ class CommandExecutor:
     ) -> Dict[str, Any]:
         from motor.orchestrator import LLMOrchestrator, StreamOrchestrator
         from ambient.telegram.handler import _edit_with_retry
-        from ambient.session import session_manager
+        from ambient.session import get_session_manager
         from telegram.constants import ParseMode
         import html
         import asyncio
         
         chat_id = update.message.chat_id
-        window = session_manager.get_conversation_window(chat_id)
+        window = get_session_manager().get_conversation_window(chat_id)
         
         if not window:
             return {
@@ -164,8 +164,8 @@ class CommandExecutor:
         
         _logger.info(f"Compressed prompt: {coding_prompt[:100]}...")
         
-        session_manager.advance_window(chat_id)
-        session_manager.add_message(chat_id, "user", command.raw_text, solo=False)
+        get_session_manager().advance_window(chat_id)
+        get_session_manager().add_message(chat_id, "user", command.raw_text, solo=False)
         
         preview = coding_prompt[:600] + ("…" if len(coding_prompt) > 600 else "")
         default_ast = manager.get_default_assistant()
@@ -193,7 +193,7 @@ class CommandExecutor:
         command: ParsedCommand,
         chat_id: int
     ) -> Dict[str, Any]:
-        from ambient.session import session_manager
+        from ambient.session import get_session_manager
         from ambient.telegram.handler import handle_solo
         
         content = command.content
@@ -263,7 +263,7 @@ class CommandExecutor:
         context: Any
     ) -> Dict[str, Any]:
         from motor.orchestrator import BRAINSTORM_SYSTEM
-        from ambient.session import session_manager
+        from ambient.session import get_session_manager
         from ambient.telegram.formatter import should_format
         from ambient.telegram.handler import _edit_with_retry
         from ambient.telegram.utils import split_message, split_message_with_code_block
@@ -274,9 +274,9 @@ class CommandExecutor:
         chat_id = update.message.chat_id
         raw_text = command.content
         
-        session_manager.add_message(chat_id, "user", raw_text, solo=False)
+        get_session_manager().add_message(chat_id, "user", raw_text, solo=False)
         
-        window = session_manager.get_conversation_window(chat_id)
+        window = get_session_manager().get_conversation_window(chat_id)
         
         streaming_msg = await update.message.reply_text("⏳ Thinking...")
         
@@ -284,7 +284,7 @@ class CommandExecutor:
         token_count = 0
         
         assistant = manager.get_default_assistant()
-        extra = session_manager.format_current_context_for_prompt()
+        extra = get_session_manager().format_current_context_for_prompt()
         prompt_val = assistant.format_prompt(window, BRAINSTORM_SYSTEM, extra_context=extra)
         
         cmd = assistant.get_command(prompt_val, agent="plan", format_json=True)
@@ -312,7 +312,7 @@ class CommandExecutor:
             nonlocal last_event_type, bubble_start_time, last_tool_name, token_count
             
             while True:
-                if session_manager.is_cancelled(streaming_msg.chat_id):
+                if get_session_manager().is_cancelled(streaming_msg.chat_id):
                     raise asyncio.CancelledError("User requested stop.")
                 
                 line = await stream.readline()
@@ -396,7 +396,7 @@ class CommandExecutor:
             await process.wait()
         except (asyncio.CancelledError, Exception) as e:
             process.terminate()
-            session_manager.unmark_cancelled(streaming_msg.chat_id)
+            get_session_manager().unmark_cancelled(streaming_msg.chat_id)
             if timer_task:
                 timer_task.cancel()
             raise e
@@ -433,7 +433,7 @@ class CommandExecutor:
             f"~ {ast.name} - {ast.get_model()}"
         )
         
-        session_manager.add_message(chat_id, "assistant", response, solo=False)
+        get_session_manager().add_message(chat_id, "assistant", response, solo=False)
         
         return {'success': True, 'action': 'brainstorm_complete', 'response': response}
 
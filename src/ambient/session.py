@@ -1,80 +1,159 @@
 from __future__ import annotations
 
 import json
-from dataclasses import asdict, dataclass, field
+import os
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set
 
 from core.events import ContextEnvelope, SessionID
 from core.logger import get_logger
 from core.telemetry import get_event_ledger
 
 SESSION_STATE_PATH = Path.home() / ".voice-to-code" / "sessions-state.json"
+SESSION_PAYLOAD_DIR = Path.home() / ".voice-to-code" / "sessions"
+SESSION_LOG_PATH = Path.home() / ".voice-to-code" / "sessions-log.jsonl"
+# Fold the log into the snapshot after this many appended entries.
+SESSION_LOG_COMPACT_THRESHOLD = 500
+# Log ops that change a session's payload file rather than just its header.
+_PAYLOAD_OPS = frozenset({"message", "clear"})
 
 _logger = get_logger()
 
 
-@dataclass
+@dataclass(slots=True)
 class SessionState:
     session_id: SessionID
     chat_id: int
     created_at: str
     last_active: str
     window_start: int = 0
-    history: List[Dict[str, Any]] = field(default_factory=list)
+    # Conversation history stored column-wise; history_entries() rebuilds the
+    # {"role", "content", "solo"} dicts used on disk and by prompt builders.
+    roles: List[str] = field(default_factory=list)
+    contents: List[str] = field(default_factory=list)
+    solo_flags: bytearray = field(default_factory=bytearray)
     context_envelope: Dict[str, Any] = field(default_factory=dict)
     working_set: List[str] = field(default_factory=list)
     pending_question: Optional[str] = None
     cancelled: bool = False
     consecutive_empty_responses: int = 0
+    # False until history/context_envelope/working_set are read from the payload file.
+    _loaded: bool = field(default=True, init=False, repr=False, compare=False)
 
     def touch(self) -> None:
         self.last_active = datetime.utcnow().isoformat()
 
-    def to_dict(self) -> Dict[str, Any]:
+    @property
+    def history_length(self) -> int:
+        return len(self.roles)
+
+    def history_entries(self, start: int = 0) -> List[Dict[str, Any]]:
+        return [
+            {"role": role, "content": content, "solo": bool(solo)}
+            for role, content, solo in zip(
+                self.roles[start:], self.contents[start:], self.solo_flags[start:]
+            )
+        ]
+
+    def append_message(self, role: str, content: str, solo: bool) -> None:
+        self.roles.append(role)
+        self.contents.append(content)
+        self.solo_flags.append(1 if solo else 0)
+
+    def is_last_message(self, role: str, content: str, solo: bool) -> bool:
+        return bool(self.roles) and (
+            self.roles[-1] == role
+            and self.contents[-1] == content
+            and bool(self.solo_flags[-1]) == solo
+        )
+
+    def clear_history(self) -> None:
+        self.roles.clear()
+        self.contents.clear()
+        self.solo_flags.clear()
+
+    def set_history(self, entries: List[Dict[str, Any]]) -> None:
+        self.roles = [entry.get("role") for entry in entries]
+        self.contents = [entry.get("content") for entry in entries]
+        self.solo_flags = bytearray(1 if entry.get("solo") else 0 for entry in entries)
+
+    def header_dict(self) -> Dict[str, Any]:
         return {
             "session_id": int(self.session_id),
             "chat_id": self.chat_id,
             "created_at": self.created_at,
             "last_active": self.last_active,
             "window_start": self.window_start,
-            "history": self.history,
-            "context_envelope": self.context_envelope,
-            "working_set": self.working_set,
             "pending_question": self.pending_question,
             "cancelled": self.cancelled,
             "consecutive_empty_responses": self.consecutive_empty_responses,
         }
 
+    def payload_dict(self) -> Dict[str, Any]:
+        return {
+            "history": self.history_entries(),
+            "context_envelope": self.context_envelope,
+            "working_set": self.working_set,
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {**self.header_dict(), **self.payload_dict()}
+
+    def load_payload(self, data: Dict[str, Any]) -> None:
+        self.set_history(data.get("history", []))
+        self.context_envelope = data.get("context_envelope", {})
+        self.working_set = data.get("working_set", [])
+        self._loaded = True
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "SessionState":
-        return cls(
+        state = cls(
             session_id=SessionID(int(data.get("session_id", 0))),
             chat_id=int(data.get("chat_id", 0)),
             created_at=data.get("created_at", datetime.utcnow().isoformat()),
             last_active=data.get("last_active", datetime.utcnow().isoformat()),
             window_start=int(data.get("window_start", 0)),
-            history=data.get("history", []),
             context_envelope=data.get("context_envelope", {}),
             working_set=data.get("working_set", []),
             pending_question=data.get("pending_question"),
             cancelled=data.get("cancelled", False),
             consecutive_empty_responses=data.get("consecutive_empty_responses", 0),
         )
+        # Index entries carry no history; legacy full entries arrive loaded.
+        state._loaded = "history" in data
+        if state._loaded:
+            state.set_history(data["history"])
+        return state
 
 
 class SessionManager:
     def __init__(self) -> None:
         self.event_ledger = get_event_ledger()
         self.state_path = SESSION_STATE_PATH
+        self.payload_dir = SESSION_PAYLOAD_DIR
+        self.log_path = SESSION_LOG_PATH
+        self._log_entries = 0
+        # Sessions whose payload file is stale; header-only changes never land here.
+        self._dirty_payloads: Set[SessionID] = set()
         self.sessions: Dict[SessionID, SessionState] = self._load_session_states()
         self.chat_index: Dict[int, SessionID] = {
             state.chat_id: state.session_id for state in self.sessions.values()
         }
         self._next_session_id = max((int(sid) for sid in self.sessions.keys()), default=0) + 1
-        for sid in list(self.sessions.keys()):
-            self._rehydrate_session(sid)
+        # Sessions from a legacy single-file state are already in memory; rehydrate
+        # them now and split them into per-session payload files below.
+        migrated = [state for state in self.sessions.values() if state._loaded]
+        for state in migrated:
+            self._rehydrate_session(state.session_id)
+            self._dirty_payloads.add(state.session_id)
+        replayed = self._replay_log()
+        # Fold a replayed log into the snapshot now: the compaction threshold
+        # only counts ops written by this process, so a log carried across
+        # restarts would otherwise keep growing and be replayed every start.
+        if migrated or replayed:
+            self._save_session_states()
         self.pending_model_selections: Dict[int, str] = {}
 
     # ── Session state persistence ────────────────────────────────────────────
@@ -83,9 +162,9 @@ class SessionManager:
         if not self.state_path.exists():
             return {}
         try:
-            with open(self.state_path, "r", encoding="utf-8") as fp:
-                raw = json.load(fp)
-        except (json.JSONDecodeError, IOError):
+            # One contiguous read; json.loads decodes bytes directly.
+            raw = json.loads(self.state_path.read_bytes())
+        except (json.JSONDecodeError, UnicodeDecodeError, IOError):
             _logger.warning("Failed to load session states")
             return {}
         result: Dict[SessionID, SessionState] = {}
@@ -98,16 +177,130 @@ class SessionManager:
         return result
 
     def _save_session_states(self) -> None:
-        payload = {str(sid): state.to_dict() for sid, state in self.sessions.items()}
-        self.state_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(self.state_path, "w", encoding="utf-8") as fp:
-            json.dump(payload, fp, indent=2)
+        # Rewrite only payloads that changed; the header index is small and
+        # always written in full.
+        for sid in self._dirty_payloads:
+            state = self.sessions.get(sid)
+            if state is not None:
+                self._write_json(self._payload_path(sid), state.payload_dict())
+        self._dirty_payloads.clear()
+        index = {str(sid): state.header_dict() for sid, state in self.sessions.items()}
+        self._write_json(self.state_path, index)
+        # The snapshot now contains everything the log recorded.
+        self.log_path.unlink(missing_ok=True)
+        self._log_entries = 0
+
+    @staticmethod
+    def _write_json(path: Path, payload: Any) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".json.tmp")
+        # Encode once and write in binary mode, skipping the text-IO layer.
+        data = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+        with open(tmp_path, "wb") as fp:
+            fp.write(data)
+            fp.flush()
+            os.fsync(fp.fileno())
+        os.replace(tmp_path, path)
+
+    def _payload_path(self, session_id: SessionID) -> Path:
+        return self.payload_dir / f"{int(session_id)}.json"
+
+    def _materialize(self, state: SessionState) -> SessionState:
+        """Load the heavy fields of a session on first touch."""
+        if state._loaded:
+            return state
+        payload: Dict[str, Any] = {}
+        path = self._payload_path(state.session_id)
+        if path.exists():
+            try:
+                payload = json.loads(path.read_bytes()) or {}
+            except (json.JSONDecodeError, UnicodeDecodeError, IOError):
+                _logger.warning(f"Failed to load session payload for session {state.session_id}")
+        state.load_payload(payload)
+        self._rehydrate_session(state.session_id)
+        return state
+
+    # ── Append-only log ─────────────────────────────────────────────────────
+    #
+    # Small mutations are written as one JSON line each and folded into the
+    # snapshot the next time it is saved. Every op records absolute values (or,
+    # for messages, the history index), so replaying a log that was already
+    # folded into the snapshot is harmless.
+
+    def _log_op(self, state: SessionState, op: str, **fields: Any) -> None:
+        entry = {"sid": int(state.session_id), "op": op, "ts": state.last_active, **fields}
+        if op in _PAYLOAD_OPS:
+            self._dirty_payloads.add(state.session_id)
+        self.log_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.log_path, "ab") as fp:
+            fp.write(json.dumps(entry, separators=(",", ":")).encode("utf-8") + b"\n")
+        self._log_entries += 1
+        if self._log_entries >= SESSION_LOG_COMPACT_THRESHOLD:
+            self._save_session_states()
+
+    def _replay_log(self) -> int:
+        """Apply the session log to the loaded snapshot; returns the lines read."""
+        if not self.log_path.exists():
+            return 0
+        try:
+            lines = self.log_path.read_bytes().splitlines()
+        except IOError:
+            _logger.warning("Failed to replay session log")
+            return 0
+        replayed = 0
+        for line in lines:
+            if not line.strip():
+                continue
+            replayed += 1
+            try:
+                entry = json.loads(line)
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                # A torn trailing line from a crash mid-append.
+                continue
+            state = self.sessions.get(SessionID(int(entry.get("sid", 0))))
+            if state is not None:
+                self._apply_log_entry(state, entry)
+        return replayed
+
+    def _apply_log_entry(self, state: SessionState, entry: Dict[str, Any]) -> None:
+        op = entry.get("op")
+        if op in _PAYLOAD_OPS:
+            self._materialize(state)
+            self._dirty_payloads.add(state.session_id)
+        if op == "message":
+            # Skip entries already folded into the snapshot.
+            if entry.get("index") != state.history_length:
+                return
+            state.append_message(entry.get("role"), entry.get("content"), bool(entry.get("solo", False)))
+        elif op == "clear":
+            state.clear_history()
+            state.window_start = 0
+            state.context_envelope.clear()
+            state.working_set.clear()
+            state.pending_question = None
+            state.cancelled = False
+        elif op == "window":
+            state.window_start = int(entry.get("window_start", 0))
+        elif op == "cancelled":
+            state.cancelled = bool(entry.get("value"))
+        elif op == "pending_question":
+            state.pending_question = entry.get("value")
+        elif op == "empty_responses":
+            state.consecutive_empty_responses = int(entry.get("value", 0))
+        else:
+            return
+        state.last_active = entry.get("ts", state.last_active)
 
     def _persist_state(self, state: SessionState) -> None:
+        assert self.chat_index.get(state.chat_id) == state.session_id, "chat_index out of sync"
         self.sessions[state.session_id] = state
-        self.chat_index[state.chat_id] = state.session_id
+        self._dirty_payloads.add(state.session_id)
         self._save_session_states()
 
+    def _link_chat(self, state: SessionState) -> None:
+        # Single mutation point for chat_index; chat_id never changes after creation.
+        self.chat_index[state.chat_id] = state.session_id
+
     def _create_session(self, chat_id: int) -> SessionState:
         session = SessionState(
             session_id=SessionID(self._next_session_id),
@@ -116,6 +309,7 @@ class SessionManager:
             last_active=datetime.utcnow().isoformat(),
         )
         self._next_session_id += 1
+        self._link_chat(session)
         self._persist_state(session)
         return session
 
@@ -140,64 +334,73 @@ class SessionManager:
             if isinstance(envelope, dict):
                 state.context_envelope = envelope
                 state.working_set = envelope.get("working_set", [])
-        self._persist_state(state)
 
     # ── Conversation helpers ────────────────────────────────────────────────
 
-    def get_or_create_session(self, chat_id: int) -> SessionState:
+    def _get_session_header(self, chat_id: int) -> SessionState:
+        """Return the session for ``chat_id`` without loading its payload."""
         if chat_id in self.chat_index:
             sid = self.chat_index[chat_id]
             return self.sessions[sid]
         return self._create_session(chat_id)
 
+    def get_or_create_session(self, chat_id: int) -> SessionState:
+        return self._materialize(self._get_session_header(chat_id))
+
+    def get_session(self, session_id: SessionID) -> Optional[SessionState]:
+        state = self.sessions.get(session_id)
+        return self._materialize(state) if state else None
+
     def add_message(self, chat_id: int, role: str, content: str, solo: bool = False) -> None:
         state = self.get_or_create_session(chat_id)
-        last_entry = state.history[-1] if state.history else None
-        if last_entry and last_entry.get("role") == role and last_entry.get("content") == content and last_entry.get("solo") == solo:
+        if state.is_last_message(role, content, solo):
             _logger.debug(
                 f"Skipping duplicate message for chat {chat_id}: role={role} content={content[:40]}"
             )
             return
-        state.history.append({"role": role, "content": content, "solo": solo})
+        index = state.history_length
+        state.append_message(role, content, solo)
         state.touch()
-        self._persist_state(state)
+        self._log_op(state, "message", index=index, role=role, content=content, solo=solo)
 
     def get_conversation_window(self, chat_id: int) -> List[Dict[str, Any]]:
         state = self.get_or_create_session(chat_id)
-        return state.history[state.window_start :]
+        return state.history_entries(state.window_start)
 
     def advance_window(self, chat_id: int) -> None:
         state = self.get_or_create_session(chat_id)
-        state.window_start = len(state.history)
+        state.window_start = state.history_length
         state.touch()
-        self._persist_state(state)
+        self._log_op(state, "window", window_start=state.window_start)
 
     def clear_conversation(self, chat_id: int) -> None:
         state = self.get_or_create_session(chat_id)
-        state.history.clear()
+        state.clear_history()
         state.window_start = 0
         state.context_envelope.clear()
         state.working_set.clear()
         state.pending_question = None
         state.cancelled = False
         state.touch()
-        self._persist_state(state)
+        self._log_op(state, "clear")
 
     # ── Cancellation hooks ─────────────────────────────────────────────────
 
     def cancel_session(self, chat_id: int) -> None:
-        state = self.get_or_create_session(chat_id)
+        state = self._get_session_header(chat_id)
         state.cancelled = True
         state.touch()
-        self._persist_state(state)
+        self._log_op(state, "cancelled", value=True)
 
     def unmark_cancelled(self, chat_id: int) -> None:
-        state = self.get_or_create_session(chat_id)
+        state = self._get_session_header(chat_id)
+        if not state.cancelled:
+            return
         state.cancelled = False
-        self._persist_state(state)
+        self._log_op(state, "cancelled", value=False)
 
     def is_cancelled(self, chat_id: int) -> bool:
-        state = self.get_or_create_session(chat_id)
+        state = self._get_session_header(chat_id)
         return state.cancelled
 
     # ── Session history / narrative ─────────────────────────────────────────
@@ -208,7 +411,7 @@ class SessionManager:
         lines = []
         if session_id:
             state = self.sessions.get(session_id)
-            summary_text = state.context_envelope.get("summary_text") if state else ""
+            summary_text = self._materialize(state).context_envelope.get("summary_text") if state else ""
             if summary_text:
                 lines.append("\nContext envelope:\n" + summary_text)
         return "\n".join(lines)
@@ -219,29 +422,33 @@ class SessionManager:
         state = self._resolve_session(int(session_id))
         state.pending_question = question
         state.touch()
-        self._persist_state(state)
+        self._log_op(state, "pending_question", value=question)
 
     def get_pending_question(self, chat_id: int) -> Optional[str]:
-        state = self.get_or_create_session(chat_id)
+        state = self._get_session_header(chat_id)
         return state.pending_question
 
     def clear_pending_question(self, chat_id: int) -> None:
-        state = self.get_or_create_session(chat_id)
+        state = self._get_session_header(chat_id)
+        if state.pending_question is None:
+            return
         state.pending_question = None
-        self._persist_state(state)
+        self._log_op(state, "pending_question", value=None)
 
     def context_summary_for_prompt(self, session_id: SessionID) -> str:
         state = self.sessions.get(session_id)
         if not state:
             return ""
-        return state.context_envelope.get("summary_text", "")
+        return self._materialize(state).context_envelope.get("summary_text", "")
 
     def update_context_envelope(self, session_id: SessionID, envelope: ContextEnvelope) -> None:
         state = self.sessions.get(session_id)
         if not state:
             return
-        context_dict = asdict(envelope)
-        state.context_envelope = context_dict
+        self._materialize(state)
+        # Shallow conversion: the stored dict shares list objects with the
+        # envelope, so callers must not mutate the envelope after handing it off.
+        state.context_envelope = envelope.to_plain()
         state.working_set = envelope.working_set
         self._persist_state(state)
 
@@ -259,10 +466,10 @@ class SessionManager:
     # ── Loop detection ────────────────────────────────────────────────────────
 
     def record_empty_response(self, chat_id: int) -> bool:
-        state = self.get_or_create_session(chat_id)
+        state = self._get_session_header(chat_id)
         state.consecutive_empty_responses += 1
         state.touch()
-        self._persist_state(state)
+        self._log_op(state, "empty_responses", value=state.consecutive_empty_responses)
         if state.consecutive_empty_responses >= 2:
             _logger.error(
                 f"LOOP DETECTED: {state.consecutive_empty_responses} consecutive empty "
@@ -272,14 +479,23 @@ class SessionManager:
         return False
 
     def reset_empty_response_counter(self, chat_id: int) -> None:
-        state = self.get_or_create_session(chat_id)
+        state = self._get_session_header(chat_id)
+        if state.consecutive_empty_responses == 0:
+            return
         state.consecutive_empty_responses = 0
         state.touch()
-        self._persist_state(state)
+        self._log_op(state, "empty_responses", value=0)
 
     def check_loop_detected(self, chat_id: int) -> bool:
-        state = self.get_or_create_session(chat_id)
+        state = self._get_session_header(chat_id)
         return state.consecutive_empty_responses >= 2
 
 
-session_manager = SessionManager()
+_session_manager: Optional[SessionManager] = None
+
+
+def get_session_manager() -> SessionManager:
+    global _session_manager
+    if _session_manager is None:
+        _session_manager = SessionManager()
+    return _session_manager
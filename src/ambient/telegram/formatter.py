@@ -9,20 +9,30 @@ logger = logging.getLogger(__name__)
 TELEGRAM_FORMATTER_ENABLED = os.getenv("TELEGRAM_FORMATTER_ENABLED", "true").lower() == "true"
 TELEGRAM_PARSE_MODE = os.getenv("TELEGRAM_PARSE_MODE", "html").lower()
 
+_HTML_TRANS = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;"})
+
+_CODE_BLOCK_RE = re.compile(r'```(\w*)\n(.*?)\n?```', re.DOTALL)
+_INLINE_CODE_RE = re.compile(r'`([^`\n]+)`')
+_BOLD_RE = re.compile(r'\*\*(.*?)\*\*', re.DOTALL)
+_ITALIC_STAR_RE = re.compile(r'\*(.*?)\*', re.DOTALL)
+_ITALIC_UNDER_RE = re.compile(r'_(.*?)_', re.DOTALL)
+
 def escape_html(text: str) -> str:
     """Escape special characters for HTML parse mode."""
     if not text:
         return ""
-    text = text.replace("&", "&amp;")
-    text = text.replace("<", "&lt;")
-    text = text.replace(">", "&gt;")
-    return text
+    # Single pass; the mapping has no overlapping replacements so order is irrelevant.
+    return text.translate(_HTML_TRANS)
 
 def format_as_html(text: str) -> str:
     """Detect common markdown patterns and convert them to HTML tags safely."""
     if not text:
         return ""
     
+    # Plain prose has nothing for the regex passes below to match.
+    if '`' not in text and '*' not in text and '_' not in text:
+        return escape_html(text)
+    
     # 1. Escape everything first to protect Telegram from stray <, >, &
     text = escape_html(text)
     
@@ -40,21 +50,21 @@ def format_as_html(text: str) -> str:
         # Content is already escaped by top-level escape_html
         return add_placeholder(f"<pre><code>{content}</code></pre>")
     
-    text = re.sub(r'```(\w*)\n(.*?)\n?```', replace_code_block, text, flags=re.DOTALL)
+    text = _CODE_BLOCK_RE.sub(replace_code_block, text)
     
     # 3. Handle inline code (single backticks)
     def replace_inline_code(match):
         content = match.group(1)
         return add_placeholder(f"<code>{content}</code>")
     
-    text = re.sub(r'`([^`\n]+)`', replace_inline_code, text)
+    text = _INLINE_CODE_RE.sub(replace_inline_code, text)
     
     # 4. Handle bold (**bold**) - use non-greedy
-    text = re.sub(r'\*\*(.*?)\*\*', r'<b>\1</b>', text, flags=re.DOTALL)
+    text = _BOLD_RE.sub(r'<b>\1</b>', text)
     
     # 5. Handle italic (*italic* or _italic_) - use non-greedy
-    text = re.sub(r'\*(.*?)\*', r'<i>\1</i>', text, flags=re.DOTALL)
-    text = re.sub(r'_(.*?)_', r'<i>\1</i>', text, flags=re.DOTALL)
+    text = _ITALIC_STAR_RE.sub(r'<i>\1</i>', text)
+    text = _ITALIC_UNDER_RE.sub(r'<i>\1</i>', text)
 
     # 6. Re-insert placeholders in reverse order to ensure integrity
     for i in range(len(placeholders) - 1, -1, -1):
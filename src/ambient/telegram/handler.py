@@ -2,6 +2,7 @@ import asyncio
 import os
 import sys
 import html
+import logging
 import py_compile
 from pathlib import Path
 from typing import Optional, Any, Dict
@@ -10,15 +11,29 @@ from telegram.constants import ParseMode
 from telegram.error import TimedOut, RetryAfter
 
 from core.logger import get_logger
-from ambient.session import session_manager
+from core.telemetry import get_event_ledger
+from ambient.session import get_session_manager
 from ambient.telegram.utils import prepare_html_preview
 
 _logger = get_logger()
 
+_PREVIEW_CHARS = 150
+
+
+def _log_preview_enabled() -> bool:
+    # Previews are built per edit; skip the slicing when INFO is filtered out.
+    return _logger.is_enabled_for(logging.INFO)
+
+
+def _preview(text: str) -> str:
+    if len(text) <= _PREVIEW_CHARS:
+        return text.replace('\n', ' ')
+    return text[:_PREVIEW_CHARS].replace('\n', ' ') + '...'
+
 
 async def _edit_with_retry(bot, chat_id: int, message_id: int, text: str, **kwargs) -> bool:
-    preview = text[:150].replace('\n', ' ') + ('...' if len(text) > 150 else '')
-    _logger.info(f"[TO-USER-EDIT] chat={chat_id} msg_id={message_id}: {preview}")
+    if _log_preview_enabled():
+        _logger.info(f"[TO-USER-EDIT] chat={chat_id} msg_id={message_id}: {_preview(text)}")
     try:
         await bot.edit_message_text(
             chat_id=chat_id,
@@ -54,8 +69,8 @@ async def _edit_with_fallback(bot, chat_id: int, message_id: int, text: str, upd
     if not success:
         _logger.warning(f"Edit failed, sending fallback message to chat {chat_id}")
         try:
-            preview = text[:150].replace('\n', ' ') + ('...' if len(text) > 150 else '')
-            _logger.info(f"[TO-USER-FALLBACK] chat={chat_id}: {preview}")
+            if _log_preview_enabled():
+                _logger.info(f"[TO-USER-FALLBACK] chat={chat_id}: {_preview(text)}")
             await bot.send_message(chat_id=chat_id, text=text, **kwargs)
             return True
         except Exception as fallback_err:
@@ -75,22 +90,22 @@ async def update_heartbeat_with_progress(
     eta_seconds: Optional[int] = None,
     tokens: int = 0
 ) -> None:
-    progress_str = f" {int(progress * 100)}%" if progress is not None else ""
-    
-    eta_str = ""
+    parts = [header, f" <i>[Wait: {elapsed}s]"]
+    if progress is not None:
+        parts.append(f" {int(progress * 100)}%")
     if eta_seconds is not None:
         if eta_seconds < 60:
-            eta_str = f" | ETA: {eta_seconds}s"
+            parts.append(f" | ETA: {eta_seconds}s")
         else:
-            eta_mins = eta_seconds // 60
-            eta_secs = eta_seconds % 60
-            eta_str = f" | ETA: {eta_mins}m{eta_secs}s"
+            eta_mins, eta_secs = divmod(eta_seconds, 60)
+            parts.append(f" | ETA: {eta_mins}m{eta_secs}s")
+    if tokens > 0:
+        parts.append(f" | Tokens: {tokens}")
+    parts.append("</i>")
+    if body:
+        parts += ["\n\n<code>", prepare_html_preview(body, limit=3500), "</code>"]
     
-    token_str = f" | Tokens: {tokens}" if tokens > 0 else ""
-    
-    body_block = f"\n\n<code>{prepare_html_preview(body, limit=3500)}</code>" if body else ""
-    
-    text = f"{header} <i>[Wait: {elapsed}s]{progress_str}{eta_str}{token_str}</i>{body_block}"
+    text = "".join(parts)
     
     await _edit_with_retry(
         bot,
@@ -101,11 +116,11 @@ async def update_heartbeat_with_progress(
     )
 
 
-def is_authorized(user_id: int, allowed_user_id: Optional[str]) -> bool:
-    return not allowed_user_id or str(user_id) == allowed_user_id
+def is_authorized(user_id: int, allowed_user_id: Optional[int]) -> bool:
+    return allowed_user_id is None or user_id == allowed_user_id
 
 
-async def handle_start(update: Update, allowed_user_id: Optional[str]) -> None:
+async def handle_start(update: Update, allowed_user_id: Optional[int]) -> None:
     user = update.effective_user
     _logger.info(f"User {user.id} ({user.username}) started the bot")
 
@@ -125,28 +140,38 @@ async def handle_start(update: Update, allowed_user_id: Optional[str]) -> None:
     )
 
 
-async def handle_clear(update: Update, allowed_user_id: Optional[str]) -> None:
+async def handle_clear(update: Update, allowed_user_id: Optional[int]) -> None:
     if not is_authorized(update.effective_user.id, allowed_user_id):
         _logger.warning(f"[AUTH DENIED] /clear from user_id={update.effective_user.id}")
         return
 
     chat_id = update.message.chat_id
     _logger.info(f"[CMD /clear] chat={chat_id} user={update.effective_user.id}")
-    session_manager.clear_conversation(chat_id)
+    get_session_manager().clear_conversation(chat_id)
     await update.message.reply_text("🧹 Session cleared. The context window is pristine and ready for a new task.")
 
 
-async def handle_cancel(update: Update, allowed_user_id: Optional[str]) -> None:
+async def handle_cancel(update: Update, allowed_user_id: Optional[int]) -> None:
     if not is_authorized(update.effective_user.id, allowed_user_id):
         _logger.warning(f"[AUTH DENIED] /cancel from user_id={update.effective_user.id}")
         return
 
     chat_id = update.message.chat_id
     _logger.info(f"[CMD /cancel] chat={chat_id} user={update.effective_user.id}")
-    session_manager.cancel_session(chat_id)
+    get_session_manager().cancel_session(chat_id)
     await update.message.reply_text("⛔ Session cancelled.")
 
 
+def _syntax_errors(py_files: list) -> list:
+    error_files = []
+    for py_file in py_files:
+        try:
+            py_compile.compile(str(py_file), doraise=True)
+        except py_compile.PyCompileError as e:
+            error_files.append(f"{py_file.name}: {str(e)}")
+    return error_files
+
+
 async def handle_restart(update: Update, context: Any, status_msg) -> None:
     chat_id = update.message.chat_id
     _logger.info(f"[CMD #restart] chat={chat_id} — running syntax check")
@@ -158,12 +183,8 @@ async def handle_restart(update: Update, context: Any, status_msg) -> None:
         text="🔍 Checking for syntax errors before restart..."
     )
     
-    error_files = []
-    for py_file in Path("src").glob("*.py"):
-        try:
-            py_compile.compile(str(py_file), doraise=True)
-        except py_compile.PyCompileError as e:
-            error_files.append(f"{py_file.name}: {str(e)}")
+    # Compile off the event loop so in-flight streaming edits keep flowing.
+    error_files = await asyncio.to_thread(_syntax_errors, list(Path("src").glob("*.py")))
     
     if error_files:
         error_list = "\n".join(error_files)
@@ -187,21 +208,23 @@ async def handle_restart(update: Update, context: Any, status_msg) -> None:
     
     argv = [arg for arg in sys.argv if arg != '--restart-chat-id' and not str(arg).replace('-', '').isdigit()]
     argv.extend(['--restart-chat-id', str(chat_id)])
-    
+
+    # execv replaces the process; drain queued telemetry first.
+    await get_event_ledger().flush()
     os.execv(sys.executable, ['python'] + argv)
 
 
 async def handle_solo(chat_id: int, content: str) -> None:
     _logger.debug(f"[SOLO] {content}")
-    session_manager.add_message(chat_id, "user", content, solo=True)
+    get_session_manager().add_message(chat_id, "user", content, solo=True)
 
 
 async def handle_stop(chat_id: int) -> None:
-    session_manager.cancel_session(chat_id)
+    get_session_manager().cancel_session(chat_id)
     _logger.info(f"[CMD #stop] chat={chat_id}: session cancellation requested")
 
 
-async def handle_format(update: Update, context: Any, allowed_user_id: Optional[str]) -> None:
+async def handle_format(update: Update, context: Any, allowed_user_id: Optional[int]) -> None:
     """Showcases the full gamut of Telegram's formatting and interactive capabilities."""
     if not is_authorized(update.effective_user.id, allowed_user_id):
         return
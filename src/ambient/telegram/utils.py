@@ -1,6 +1,7 @@
 import os
-import re
+import html
 import logging
+from functools import lru_cache
 
 logger = logging.getLogger(__name__)
 
@@ -14,6 +15,12 @@ CODE_BLOCK_SUFFIX = "\n```"
 
 NUMBERING_FORMAT = " [{current}/{total}]"
 
+_SENTENCE_ENDINGS = ('. ', '! ', '? ', '.\n', '!\n', '?\n')
+
+# Texts at least this long are split through a small result cache; shorter
+# ones are cheaper to split again than to hash and look up.
+SPLIT_CACHE_MIN_LENGTH = 2048
+
 
 def calculate_message_overhead(text: str, parse_mode: str | None) -> int:
     """Calculate overhead added by formatting."""
@@ -24,40 +31,82 @@ def calculate_message_overhead(text: str, parse_mode: str | None) -> int:
     return 0
 
 
+def utf16_len(text: str) -> int:
+    """Length of ``text`` in UTF-16 code units, the unit Telegram limits count."""
+    if text.isascii():
+        return len(text)
+    return len(text.encode('utf-16-le', 'surrogatepass')) // 2
+
+
+def _utf16_prefix_length(text: str, limit: int) -> int:
+    """Number of leading characters of ``text`` that fit in ``limit`` UTF-16 units."""
+    window = text[:limit]
+    if window.isascii():
+        return len(window)
+    encoded = window.encode('utf-16-le', 'surrogatepass')
+    if len(encoded) <= 2 * limit:
+        return len(window)
+    # Dropping a trailing half surrogate pair keeps the cut on a character.
+    return len(encoded[:2 * limit].decode('utf-16-le', 'ignore'))
+
+
 def is_within_limit(text: str, limit: int = TELEGRAM_MAX_MESSAGE_LENGTH) -> bool:
     """Check if message is within Telegram's length limit."""
-    return len(text) <= limit
+    # Every character is at least one UTF-16 unit, so longer strings never fit.
+    return len(text) <= limit and utf16_len(text) <= limit
 
 
 def find_split_point(text: str, max_length: int) -> int:
     """Find the best position to split the text."""
-    if len(text) <= max_length:
-        return len(text)
-    
-    search_text = text[:max_length]
+    return _find_split_point(text, 0, max_length)
+
+
+def _find_split_point(text: str, start: int, max_length: int) -> int:
+    """find_split_point for ``text[start:]``, without slicing; relative to ``start``."""
+    if len(text) - start <= max_length:
+        return len(text) - start
     
-    newline_pos = search_text.rfind('\n')
+    # Searches run on bounded ranges of ``text`` rather than a sliced copy,
+    # and each later search only covers the region that could still beat
+    # its threshold, so the window is scanned roughly once overall.
+    end = start + max_length
+    newline_pos = text.rfind('\n', start, end) - start
     if newline_pos > max_length * 0.7:
         return newline_pos
     
-    double_newline_pos = search_text.rfind('\n\n')
-    if double_newline_pos > max_length * 0.5:
-        return double_newline_pos
+    # A double newline can only end at or before the last single newline.
+    if newline_pos > max_length * 0.5:
+        double_newline_pos = text.rfind('\n\n', start, start + newline_pos + 1) - start
+        if double_newline_pos > max_length * 0.5:
+            return double_newline_pos
     
+    sentence_floor = start + int(max_length * 0.6) + 1
     sentence_end = max(
-        search_text.rfind('. '),
-        search_text.rfind('! '),
-        search_text.rfind('? '),
-        search_text.rfind('.\n'),
-        search_text.rfind('!\n'),
-        search_text.rfind('?\n'),
-    )
+        text.rfind(marker, sentence_floor, end)
+        for marker in _SENTENCE_ENDINGS
+    ) - start
     if sentence_end > max_length * 0.6:
         return sentence_end + 1
     
     return max_length
 
 
+def _numbering_overhead(text_length: int, max_length: int, units_per_char: int = 1) -> int:
+    """Upper bound on the width of a " [i/total]" tag for this split.
+    
+    find_split_point never cuts below half of the characters that fit in the
+    available length, which is at least ``available // units_per_char``, so a
+    text cannot produce more than ``2 * text_length // that + 2`` chunks.
+    """
+    width = len(NUMBERING_FORMAT.format(current=1, total=1))
+    while True:
+        max_chunks = 2 * text_length // max((max_length - width) // units_per_char, 1) + 2
+        needed = len(NUMBERING_FORMAT.format(current=max_chunks, total=max_chunks))
+        if needed <= width:
+            return width
+        width = needed
+
+
 def split_message(
     text: str,
     max_length: int = TELEGRAM_SAFE_MESSAGE_LENGTH,
@@ -66,6 +115,9 @@ def split_message(
     """
     Split a message into chunks that fit within Telegram's limits.
     
+    Lengths are measured in UTF-16 code units, as Telegram counts them, so
+    characters outside the BMP (most emoji) take two units each.
+    
     Args:
         text: The message text to split
         max_length: Maximum length per chunk (default: TELEGRAM_SAFE_MESSAGE_LENGTH)
@@ -80,55 +132,63 @@ def split_message(
     if is_within_limit(text, max_length):
         return [text]
     
+    if len(text) >= SPLIT_CACHE_MIN_LENGTH:
+        # Copy so callers can't mutate the cached result.
+        return list(_split_message_cached(text, max_length, add_numbering))
+    return _split_message(text, max_length, add_numbering)
+
+
+@lru_cache(maxsize=32)
+def _split_message_cached(text: str, max_length: int, add_numbering: bool) -> tuple[str, ...]:
+    return tuple(_split_message(text, max_length, add_numbering))
+
+
+def _split_message(text: str, max_length: int, add_numbering: bool) -> list[str]:
+    # Numbering is appended after splitting, once the real total is known, so
+    # reserve room for the widest tag the split could need.
+    available = max_length
+    if add_numbering:
+        units_per_char = 1 if utf16_len(text) == len(text) else 2
+        available -= _numbering_overhead(len(text), max_length, units_per_char)
+    # Limits too small for the tag still have to make progress.
+    available = max(available, 1)
+    
+    # Walk ``text`` by offset; each chunk is the only slice taken.
+    ascii_text = text.isascii()
+    text_length = len(text)
     chunks = []
-    remaining = text
-    chunk_num = 0
+    start = 0
     
-    while remaining:
-        chunk_num += 1
-        
-        overhead = 0
-        if add_numbering:
-            overhead = len(NUMBERING_FORMAT.format(current=chunk_num, total="?"))
-        
-        available = max_length - overhead
-        
-        if len(remaining) <= available:
-            chunk = remaining
-            remaining = ""
+    while start < text_length:
+        rest = text_length - start
+        if rest <= available and (ascii_text or utf16_len(text[start:]) <= available):
+            chunk = text[start:]
+            start = text_length
         else:
-            split_pos = find_split_point(remaining, available)
+            if ascii_text:
+                fit = available
+            else:
+                fit = _utf16_prefix_length(text[start:start + available], available)
+            split_pos = _find_split_point(text, start, fit)
             if split_pos == 0:
-                split_pos = available
-            chunk = remaining[:split_pos]
-            remaining = remaining[split_pos:].lstrip('\n ')
-        
-        if add_numbering and remaining:
-            total_estimate = chunk_num + (len(remaining) // available) + 1
-            chunk += NUMBERING_FORMAT.format(current=chunk_num, total=total_estimate)
+                split_pos = fit or 1
+            chunk = text[start:start + split_pos]
+            start += split_pos
+            while start < text_length and text[start] in '\n ':
+                start += 1
         
         if chunk:
             chunks.append(chunk)
     
     if add_numbering and len(chunks) > 1:
-        chunks = _renumber_chunks(chunks)
+        total = len(chunks)
+        for i in range(total - 1):
+            chunks[i] = f"{chunks[i].rstrip()} [{i + 1}/{total}]"
+        chunks[-1] = chunks[-1].rstrip()
     
     return [c for c in chunks if c.strip()]
 
 
-def _renumber_chunks(chunks: list[str]) -> list[str]:
-    """Update chunk numbering to reflect actual total count."""
-    total = len(chunks)
-    result = []
-    for i, chunk in enumerate(chunks, 1):
-        chunk = re.sub(r'\s\[\d+/\d+\]\s*$', '', chunk)
-        chunk = chunk.rstrip()
-        if i < total:
-            chunk += f" [{i}/{total}]"
-        result.append(chunk)
-    return result
-
-
 def split_message_with_code_block(
     text: str,
     max_length: int = TELEGRAM_SAFE_MESSAGE_LENGTH,
@@ -164,12 +224,18 @@ def prepare_html_preview(text: str, limit: int = 3500) -> str:
     Escape text for HTML and truncate to fit within a Telegram message limit.
     Ensures we don't break HTML entities during truncation.
     """
-    import html
     if not text:
         return ""
     
-    escaped = html.escape(text)
-    if len(escaped) <= limit:
+    # Escaping never shrinks a character, so the last `limit` escaped
+    # characters always come from the last `limit` source characters.
+    # Escaping just that tail keeps the cost flat as streaming buffers grow.
+    overflow = len(text) > limit
+    tail = text[-limit:] if overflow else text
+    
+    # Quotes need no escaping in element content, only &, < and >.
+    escaped = html.escape(tail, quote=False)
+    if not overflow and len(escaped) <= limit:
         return escaped
     
     # Truncate from the end (since we usually show the tail of the buffer)
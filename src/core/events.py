@@ -30,6 +30,12 @@ class ContextEnvelope:
     summary_text: str = ""
     working_set: List[str] = field(default_factory=list)
 
+    def to_plain(self) -> Dict[str, Any]:
+        """Shallow, JSON-ready view; lists are shared with the envelope, not copied."""
+        plain = dict(self.__dict__)
+        plain["circles"] = [dict(circle.__dict__) for circle in self.circles]
+        return plain
+
 
 class WorkflowState(Enum):
     TRANSCRIBING = "transcribing"
@@ -105,6 +105,9 @@ class VoiceToCodeLogger:
         self.file_handler.setLevel(log_level)
         self.console_handler.setLevel(log_level)
     
+    def is_enabled_for(self, level: int) -> bool:
+        return self.logger.isEnabledFor(level)
+    
     def debug(self, msg: str, **kwargs) -> None:
         self.logger.debug(self._format_message(msg, **kwargs))
     
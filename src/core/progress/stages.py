@@ -9,9 +9,11 @@ For basic stage types, see progress.py
 For ETA estimation, see progress_estimator.py
 """
 
+from collections import deque
 from enum import Enum
-from typing import Optional, Callable, Dict, Any, List
+from typing import Optional, Callable, Deque, Dict, Any, List
 from dataclasses import dataclass, field
+import sys
 import time
 import asyncio
 
@@ -20,30 +22,43 @@ from core.progress.progress import ProcessingStage, ProgressTracker
 
 _logger = get_logger()
 
+# Finished stages kept for get_history(); older entries are dropped.
+STAGE_HISTORY_LIMIT = 128
+
+# The console heartbeat line is only useful on an interactive terminal.
+_STDOUT_IS_TTY = sys.stdout.isatty()
+
 
 @dataclass
 class StageMetrics:
     stage: ProcessingStage
-    start_time: float = field(default_factory=time.time)
+    # Monotonic clock readings: immune to wall-clock jumps.
+    start_time: float = field(default_factory=time.monotonic)
     end_time: Optional[float] = None
     token_count: int = 0
     metadata: Dict[str, Any] = field(default_factory=dict)
     
     @property
     def duration_ms(self) -> int:
-        end = self.end_time or time.time()
+        end = self.end_time or time.monotonic()
         return int((end - self.start_time) * 1000)
     
     @property
     def elapsed_s(self) -> float:
-        return time.time() - self.start_time
+        return time.monotonic() - self.start_time
+    
+    def _elapsed(self, now: float) -> float:
+        return now - self.start_time
 
 
 class StageTracker:
     def __init__(self):
         self._current_stage: Optional[ProcessingStage] = None
         self._current_metrics: Optional[StageMetrics] = None
-        self._stage_history: List[StageMetrics] = []
+        self._stage_history: Deque[StageMetrics] = deque(maxlen=STAGE_HISTORY_LIMIT)
+        # Running sum of weights of finished stages, maintained on append. It
+        # is independent of the bounded history, so eviction does not move it.
+        self._completed_weight_sum = 0.0
         self._stage_weights: Dict[ProcessingStage, float] = {
             ProcessingStage.COMPRESSING: 0.1,
             ProcessingStage.INVOKING_ASSISTANT: 0.15,
@@ -61,7 +76,7 @@ class StageTracker:
         self._current_stage = stage
         self._current_metrics = StageMetrics(
             stage=stage,
-            start_time=time.time(),
+            start_time=time.monotonic(),
             metadata=metadata
         )
         
@@ -70,8 +85,9 @@ class StageTracker:
     
     def _finalize_current_stage(self) -> None:
         if self._current_metrics:
-            self._current_metrics.end_time = time.time()
+            self._current_metrics.end_time = time.monotonic()
             self._stage_history.append(self._current_metrics)
+            self._completed_weight_sum += self.get_stage_weight(self._current_metrics.stage)
             _logger.log_stage_complete(
                 self._current_metrics.stage,
                 duration_ms=self._current_metrics.duration_ms,
@@ -92,12 +108,6 @@ class StageTracker:
             self._current_metrics.metadata.update(metadata)
     
     def complete_stage(self) -> None:
-        if self._current_stage:
-            _logger.log_stage_complete(
-                self._current_stage,
-                duration_ms=self._current_metrics.duration_ms if self._current_metrics else 0,
-                tokens=self._current_metrics.token_count if self._current_metrics else 0
-            )
         self._finalize_current_stage()
         self._current_stage = None
         self._current_metrics = None
@@ -132,14 +142,18 @@ class StageTracker:
     def get_stage_weight(self, stage: ProcessingStage) -> float:
         return self._stage_weights.get(stage, 0.1)
     
-    def estimate_overall_progress(self) -> float:
-        completed_progress = 0.0
-        for metrics in self._stage_history:
-            completed_progress += self.get_stage_weight(metrics.stage)
+    def elapsed_at(self, now: float) -> float:
+        """Elapsed seconds in the current stage at a ``time.monotonic()`` snapshot."""
+        if self._current_metrics:
+            return self._current_metrics._elapsed(now)
+        return 0.0
+    
+    def estimate_overall_progress(self, now: Optional[float] = None) -> float:
+        completed_progress = self._completed_weight_sum
         
         if self._current_stage and self._current_metrics:
             current_weight = self.get_stage_weight(self._current_stage)
-            elapsed = self._current_metrics.elapsed_s
+            elapsed = self._current_metrics._elapsed(time.monotonic() if now is None else now)
             
             estimated_stage_duration = self._estimate_stage_duration(self._current_stage)
             if estimated_stage_duration > 0:
@@ -164,12 +178,13 @@ class StageTracker:
         return stage_durations.get(stage, 30.0)
     
     def get_history(self) -> List[StageMetrics]:
-        return self._stage_history.copy()
+        return list(self._stage_history)
     
     def reset(self) -> None:
         self._current_stage = None
         self._current_metrics = None
         self._stage_history.clear()
+        self._completed_weight_sum = 0.0
 
 
 class HeartbeatManager:
@@ -177,6 +192,7 @@ class HeartbeatManager:
         self._interval = interval_seconds
         self._task: Optional[asyncio.Task] = None
         self._is_running = False
+        self._stop_event = asyncio.Event()
         self._callbacks: List[Callable[[], Dict[str, Any]]] = []
     
     def add_callback(self, callback: Callable[[], Dict[str, Any]]) -> None:
@@ -187,14 +203,20 @@ class HeartbeatManager:
             return
         
         self._is_running = True
+        self._stop_event.clear()
         
         async def heartbeat_loop():
-            while self._is_running:
-                await asyncio.sleep(self._interval)
-                if not self._is_running:
+            while True:
+                # Wakes immediately when stop() sets the event.
+                try:
+                    await asyncio.wait_for(self._stop_event.wait(), timeout=self._interval)
                     break
+                except asyncio.TimeoutError:
+                    pass
                 
-                elapsed = int(stage_tracker.elapsed_s)
+                # One clock read per tick, shared by every elapsed computation.
+                now = time.monotonic()
+                elapsed = int(stage_tracker.elapsed_at(now))
                 if elapsed < 10:
                     continue
                 
@@ -202,15 +224,18 @@ class HeartbeatManager:
                     'stage': stage_tracker.current_stage,
                     'elapsed_s': elapsed,
                     'tokens': stage_tracker.token_count,
-                    'progress': stage_tracker.estimate_overall_progress(),
+                    'progress': stage_tracker.estimate_overall_progress(now=now),
                 }
                 
-                for callback in self._callbacks:
+                # Snapshot so add_callback() during a tick can't disturb iteration.
+                outputs = []
+                for callback in tuple(self._callbacks):
                     try:
-                        callback_data = callback()
-                        progress_data.update(callback_data)
+                        outputs.append(callback())
                     except Exception as e:
                         _logger.warning(f"Heartbeat callback error: {e}")
+                for callback_data in outputs:
+                    progress_data.update(callback_data)
                 
                 self._log_heartbeat(progress_data)
         
@@ -218,12 +243,9 @@ class HeartbeatManager:
     
     async def stop(self) -> None:
         self._is_running = False
+        self._stop_event.set()
         if self._task:
-            self._task.cancel()
-            try:
-                await self._task
-            except asyncio.CancelledError:
-                pass
+            await self._task
             self._task = None
     
     def _log_heartbeat(self, data: Dict[str, Any]) -> None:
@@ -245,9 +267,10 @@ class HeartbeatManager:
             progress=progress
         )
         
-        progress_str = f" [{int(progress*100)}%]" if progress is not None else ""
-        eta_str = f" ETA: {eta_seconds//60}m{eta_seconds%60}s" if eta_seconds and eta_seconds < 3600 else ""
-        print(f"⏳ [{elapsed_s}s] {stage_str}{progress_str}{eta_str}")
+        if _STDOUT_IS_TTY:
+            progress_str = f" [{int(progress*100)}%]" if progress is not None else ""
+            eta_str = f" ETA: {eta_seconds//60}m{eta_seconds%60}s" if eta_seconds and eta_seconds < 3600 else ""
+            print(f"⏳ [{elapsed_s}s] {stage_str}{progress_str}{eta_str}")
     
     @property
     def interval(self) -> int:
@@ -19,7 +19,7 @@ from core.events import (
 from core.interfaces import DeliveryInterface
 from core.message import Message
 from srm.context import SRMContextEngine
-from ambient.session import session_manager
+from ambient.session import get_session_manager
 from core.telemetry import EventLedger
 from core.logger import get_logger
 from core.services.orchestrator_service import OrchestratorService
@@ -61,7 +61,7 @@ class AssistantService:
     ) -> None:
         """Run the full #code workflow then emit a post-workflow session report."""
 
-        state = session_manager.get_or_create_session(message.chat_id)
+        state = get_session_manager().get_or_create_session(message.chat_id)
         session_id = state.session_id
 
         _logger.info(
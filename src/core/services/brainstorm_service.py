@@ -21,7 +21,7 @@ from motor.orchestrator import BRAINSTORM_SYSTEM, StreamOrchestrator
 from ambient.observability.hub import get_observability_hub
 from core.progress.progress import ProgressTracker
 from core.logger import get_logger
-from ambient.session import session_manager
+from ambient.session import get_session_manager
 from motor.manager import manager
 from core.telemetry import get_event_ledger
 
@@ -118,11 +118,11 @@ class BrainstormService:
                 _logger.info(f"[BRAINSTORM OUTPUT length={len(result.output)}]")
                 _logger.debug(f"[BRAINSTORM OUTPUT CONTENT]\n{result.output}")
                 await self._emit(queue, ContentDelta(text=result.output, state=current_state))
-                session_manager.add_message(chat_id, "assistant", result.output, solo=False)
+                get_session_manager().add_message(chat_id, "assistant", result.output, solo=False)
 
             if result.question:
                 _logger.info(f"[BRAINSTORM QUESTION DETECTED] {result.question!r}")
-                session_manager.set_pending_question(session_id, result.question)
+                get_session_manager().set_pending_question(session_id, result.question)
                 await self._emit(
                     queue,
                     TaskInteraction(
@@ -25,7 +25,7 @@ from core.progress.progress import ProgressTracker
 from motor.orchestrator import LLMOrchestrator, StreamOrchestrator
 from core.logger import get_logger
 from core.progress.estimator import ProgressEstimator
-from ambient.session import session_manager
+from ambient.session import get_session_manager
 from core.message import Message
 from core.telemetry import get_event_ledger
 
@@ -93,7 +93,7 @@ class OrchestratorService:
 
             _logger.info(f"[#CODE WORKFLOW START] session={session_id} chat={chat_id} text={user_text!r}")
 
-            window = session_manager.get_conversation_window(chat_id)
+            window = get_session_manager().get_conversation_window(chat_id)
             if not window:
                 message = "💭 Nothing to compress yet — send some context before #code."
                 await self._emit(queue, ProcessingFailed(message, current_state), session_id)
@@ -124,8 +124,8 @@ class OrchestratorService:
             prompt = srm_context
 
             
-            session_manager.advance_window(chat_id)
-            session_manager.add_message(chat_id, "user", user_text, solo=False)
+            get_session_manager().advance_window(chat_id)
+            get_session_manager().add_message(chat_id, "user", user_text, solo=False)
 
             estimator = ProgressEstimator()
             complexity = estimator.analyze_prompt_complexity(prompt)
@@ -157,10 +157,10 @@ class OrchestratorService:
             await self._log_llm_thought(session_id, "coding", "Invoking the coding assistant")
 
             result = await self._execute_streaming(prompt, session_id, queue, current_state)
-            session_manager.add_message(chat_id, "assistant", result.output or "", solo=False)
+            get_session_manager().add_message(chat_id, "assistant", result.output or "", solo=False)
 
             if result.question:
-                session_manager.set_pending_question(session_id, result.question)
+                get_session_manager().set_pending_question(session_id, result.question)
                 await self._emit(
                     queue,
                     TaskInteraction(
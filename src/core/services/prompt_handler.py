@@ -7,7 +7,7 @@ from typing import Iterable
 from core.interfaces import DeliveryInterface, ProgressPayload
 from core.message import Message
 from motor.orchestrator import StreamOrchestrator
-from ambient.session import session_manager
+from ambient.session import get_session_manager
 
 
 async def handle_prompt_intent(
@@ -18,8 +18,8 @@ async def handle_prompt_intent(
     edit_rate_limit: float = 0.5,
 ) -> None:
     chat_id = request.chat_id
-    state = session_manager.get_or_create_session(chat_id)
-    session_manager.add_message(chat_id, "user", prompt, solo=False)
+    state = get_session_manager().get_or_create_session(chat_id)
+    get_session_manager().add_message(chat_id, "user", prompt, solo=False)
 
     status_msg = await delivery.send_message(
         Message(None, chat_id, None, "🚀 Running prompt directly…", reply_to_id=request.message_id)
@@ -52,7 +52,7 @@ async def handle_prompt_intent(
         await _send_chunks(request, result.output, delivery)
 
     if result.question:
-        session_manager.set_pending_question(state.session_id, result.question)
+        get_session_manager().set_pending_question(state.session_id, result.question)
         await delivery.send_message(
             Message(
                 None,
@@ -63,7 +63,7 @@ async def handle_prompt_intent(
             )
         )
 
-    session_manager.add_message(chat_id, "assistant", result.output or "", solo=False)
+    get_session_manager().add_message(chat_id, "assistant", result.output or "", solo=False)
 
 
 async def _send_chunks(
@@ -2,14 +2,36 @@ from __future__ import annotations
 
 import asyncio
 import json
+import os
+import threading
 import time
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from core.events import SessionID
+from core.logger import get_logger
+
+# Optional faster codec; the ledger format is plain JSON lines either way.
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 EVENT_LEDGER_PATH = Path.home() / ".voice-to-code" / "event-ledger.jsonl"
+# Maximum number of queued events written per append.
+LEDGER_BATCH_SIZE = 256
+
+_logger = get_logger()
+
+
+def _dumps_line(entry: Dict[str, Any]) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(entry, option=orjson.OPT_NON_STR_KEYS) + b"\n"
+    return (json.dumps(entry) + "\n").encode("utf-8")
+
+
+_loads = orjson.loads if orjson is not None else json.loads
 
 
 @dataclass
@@ -25,7 +47,16 @@ class EventLedger:
     def __init__(self, path: Path = EVENT_LEDGER_PATH) -> None:
         self.path = path
         self.path.parent.mkdir(parents=True, exist_ok=True)
-        self._lock = asyncio.Lock()
+        # Sidecar "session_id<TAB>byte_offset" lines so get_events can seek
+        # straight to one session's entries instead of scanning the ledger.
+        self.index_path = self.path.with_suffix(".idx")
+        self._index: Optional[Dict[int, List[int]]] = None
+        self._index_lock = threading.Lock()
+        # (session_id, serialized line) pairs waiting for the writer task; one
+        # writer drains them in batches so bursts cost one thread hop and one
+        # open() per batch.
+        self._queue: asyncio.Queue[Tuple[int, bytes]] = asyncio.Queue()
+        self._writer_task: Optional[asyncio.Task] = None
 
     async def log_event(
         self,
@@ -34,6 +65,7 @@ class EventLedger:
         payload: Optional[Dict[str, Any]] = None,
         reason: Optional[str] = None,
     ) -> None:
+        """Queue an event for the writer task; await flush() when it must be on disk."""
         payload = payload or {}
         entry = {
             "session_id": int(session_id),
@@ -42,27 +74,124 @@ class EventLedger:
             "payload": payload,
             "reason": reason,
         }
-        async with self._lock:
-            await asyncio.to_thread(self._append_entry, entry)
+        self._queue.put_nowait((entry["session_id"], _dumps_line(entry)))
+        if self._writer_task is None or self._writer_task.done():
+            self._writer_task = asyncio.create_task(self._writer_loop())
+
+    async def flush(self) -> None:
+        """Wait until every queued event has been written to disk."""
+        if self._writer_task is not None and not self._writer_task.done():
+            await self._queue.join()
+
+    async def close(self) -> None:
+        """Write every queued event, then stop the writer task."""
+        await self.flush()
+        task, self._writer_task = self._writer_task, None
+        if task is None or task.done():
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    async def _writer_loop(self) -> None:
+        while True:
+            batch = [await self._queue.get()]
+            while not self._queue.empty() and len(batch) < LEDGER_BATCH_SIZE:
+                batch.append(self._queue.get_nowait())
+            try:
+                await asyncio.to_thread(self._append_lines, batch)
+            except OSError as exc:
+                _logger.error(f"Failed to write {len(batch)} telemetry events: {exc}")
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    def _append_lines(self, lines: List[Tuple[int, bytes]]) -> None:
+        with self._index_lock:
+            # Index existing lines first: _load_index only scans past the last
+            # indexed offset, so lines from before the index would be skipped.
+            self._ensure_index()
+            entries: List[Tuple[int, int]] = []
+            with open(self.path, "ab", buffering=1 << 16) as ledger:
+                offset = ledger.seek(0, os.SEEK_END)
+                for session_id, line in lines:
+                    entries.append((session_id, offset))
+                    offset += len(line)
+                ledger.write(b"".join(line for _, line in lines))
+            self._append_index(entries)
+
+    def _append_index(self, entries: List[Tuple[int, int]]) -> None:
+        if not entries:
+            return
+        with open(self.index_path, "a", encoding="utf-8") as index_file:
+            index_file.write("".join(f"{sid}\t{offset}\n" for sid, offset in entries))
+        if self._index is not None:
+            for sid, offset in entries:
+                self._index.setdefault(sid, []).append(offset)
 
-    def _append_entry(self, entry: Dict[str, Any]) -> None:
-        with open(self.path, "a", encoding="utf-8") as ledger:
-            json.dump(entry, ledger)
-            ledger.write("\n")
+    def _ensure_index(self) -> Dict[int, List[int]]:
+        """Load the index on first use; callers must hold ``_index_lock``."""
+        if self._index is None:
+            if self.path.exists():
+                self._index = self._load_index()
+            else:
+                # Offsets in an index without its ledger point at nothing.
+                self.index_path.unlink(missing_ok=True)
+                self._index = {}
+        return self._index
+
+    def _load_index(self) -> Dict[int, List[int]]:
+        """Read the sidecar index, then index any ledger lines it is missing.
+
+        The tail scan covers ledgers written before the index existed and
+        batches whose index append was lost to a crash.
+        """
+        index: Dict[int, List[int]] = {}
+        last_offset = -1
+        if self.index_path.exists():
+            for line in self.index_path.read_text(encoding="utf-8").splitlines():
+                sid, _, offset = line.partition("\t")
+                try:
+                    index.setdefault(int(sid), []).append(int(offset))
+                except ValueError:
+                    continue
+                last_offset = max(last_offset, int(offset))
+
+        missing: List[Tuple[int, int]] = []
+        with open(self.path, "rb") as ledger:
+            if last_offset >= 0:
+                ledger.seek(last_offset)
+                ledger.readline()
+            while True:
+                offset = ledger.tell()
+                line = ledger.readline()
+                if not line:
+                    break
+                try:
+                    sid = int(_loads(line).get("session_id"))
+                except (ValueError, TypeError, AttributeError):
+                    continue
+                index.setdefault(sid, []).append(offset)
+                missing.append((sid, offset))
+        self._append_index(missing)
+        return index
 
     def get_events(self, session_id: SessionID) -> List[TelemetryEvent]:
         if not self.path.exists():
             return []
 
+        with self._index_lock:
+            offsets = list(self._ensure_index().get(int(session_id), ()))
+
         events: List[TelemetryEvent] = []
-        with open(self.path, "r", encoding="utf-8") as ledger:
-            for line in ledger:
-                line = line.strip()
-                if not line:
-                    continue
+        with open(self.path, "rb") as ledger:
+            for offset in offsets:
+                ledger.seek(offset)
                 try:
-                    raw = json.loads(line)
-                except json.JSONDecodeError:
+                    raw = _loads(ledger.readline())
+                except (json.JSONDecodeError, UnicodeDecodeError):
                     continue
                 if raw.get("session_id") != int(session_id):
                     continue
@@ -29,7 +29,7 @@ from srm.context import SRMContextEngine
 from core.telemetry import get_event_ledger
 from core.services.assistant_service import AssistantService
 from core.services.brainstorm_service import BrainstormService
-from ambient.session import session_manager
+from ambient.session import get_session_manager
 from ambient.telegram.handler import (
     handle_clear,
     handle_cancel,
@@ -46,13 +46,29 @@ from core.events import SessionID
 load_dotenv()
 
 TOKEN = os.getenv("TELEGRAM_BOT_TOKEN")
-ALLOWED_USER_ID = os.getenv("ALLOWED_USER_ID")
+_ALLOWED_USER_ID_RAW = os.getenv("ALLOWED_USER_ID")
 FILE_PATH = os.getenv("FILE_PATH") or "."
 TELEGRAM_EDIT_RATE_LIMIT = float(os.getenv("TELEGRAM_EDIT_RATE_LIMIT", "0.5"))
 OBSERVABILITY_HOST = os.getenv("OBSERVABILITY_HOST", OBSERVABILITY_HOST)
 OBSERVABILITY_PORT = int(os.getenv("OBSERVABILITY_PORT", OBSERVABILITY_PORT))
 
 _logger = get_logger()
+
+
+def _parse_allowed_user_id(raw: Optional[str]) -> Optional[int]:
+    """Parse ALLOWED_USER_ID once so each auth check is an int comparison."""
+    if not raw:
+        return None
+    try:
+        return int(raw.strip())
+    except ValueError:
+        # A placeholder value locks everyone out (no Telegram user has id 0),
+        # so /start still replies with the caller's real ID.
+        _logger.error(f"ALLOWED_USER_ID is not numeric: {raw!r}")
+        return 0
+
+
+ALLOWED_USER_ID = _parse_allowed_user_id(_ALLOWED_USER_ID_RAW)
 _processed_message_ids: set[int] = set()
 
 event_ledger = get_event_ledger()
@@ -105,7 +121,7 @@ async def handle_message(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
     incoming = Message(user.id, chat_id, msg_id, raw_text, reply_to_id=reply_to)
     delivery = TelegramDeliveryAdapter(context.bot)
 
-    pending_mode = session_manager.get_pending_model_selection(chat_id)
+    pending_mode = get_session_manager().get_pending_model_selection(chat_id)
     if pending_mode:
         _logger.info(f"[ROUTE] chat={chat_id} → model_selection (pending_mode={pending_mode}) choice={raw_text!r}")
         await _apply_model_selection(chat_id, pending_mode, raw_text, update, context)
@@ -114,7 +130,7 @@ async def handle_message(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
     if lower == "#model" or lower == "#model #code":
         mode = "build" if lower == "#model #code" else "plan"
         _logger.info(f"[ROUTE] chat={chat_id} → #model mode={mode}")
-        session_manager.set_pending_model_selection(chat_id, mode)
+        get_session_manager().set_pending_model_selection(chat_id, mode)
         await update.message.reply_text(_build_model_list_message(mode), parse_mode=ParseMode.HTML)
         return
 
@@ -159,14 +175,14 @@ async def handle_message(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
             await delivery.send_message(Message(None, chat_id, None, "Please include a prompt after #prompt."))
             return
 
-        pending_question = session_manager.get_pending_question(chat_id)
+        pending_question = get_session_manager().get_pending_question(chat_id)
         if pending_question:
             _logger.info(f"[#PROMPT] chat={chat_id}: injecting pending question: {pending_question!r}")
             prompt_body = (
                 f"[Context: The assistant previously asked: \"{pending_question}\"]\n\n"
                 f"User response: {prompt_body}"
             )
-            session_manager.clear_pending_question(chat_id)
+            get_session_manager().clear_pending_question(chat_id)
             _logger.info(f"[CONTEXT] chat={chat_id}: included pending question in prompt")
 
         _logger.info(f"[#PROMPT] chat={chat_id}: prompt_body={prompt_body!r}")
@@ -202,8 +218,8 @@ async def handle_message(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
                 _logger.warning(f"[ROUTE] chat={chat_id}: unknown tag #{tag} — falling through to brainstorm")
 
     _logger.info(f"[ROUTE] chat={chat_id} → brainstorm text={raw_text!r}")
-    session_state = session_manager.get_or_create_session(chat_id)
-    session_manager.add_message(chat_id, "user", raw_text, solo=False)
+    session_state = get_session_manager().get_or_create_session(chat_id)
+    get_session_manager().add_message(chat_id, "user", raw_text, solo=False)
     event_stream = brainstorm_service.stream_brainstorm(session_state.session_id, chat_id, incoming)
     try:
         await delivery.consume_domain_events(event_stream, incoming)
@@ -255,7 +271,7 @@ def _build_model_list_message(mode: str) -> str:
 async def _apply_model_selection(chat_id: int, mode: str, choice: str, update, context) -> None:
     from pathlib import Path
 
-    session_manager.clear_pending_model_selection(chat_id)
+    get_session_manager().clear_pending_model_selection(chat_id)
     ast = manager.get_default_assistant()
     if not isinstance(ast, OpenCodeAssistant):
         await update.message.reply_text("⚠️ Model switching is only supported for the OpenCode assistant.")
@@ -377,6 +393,7 @@ def main() -> None:
 
     async def post_shutdown(application: Application) -> None:
         await _stop_observability(application)
+        await event_ledger.close()
 
     request = HTTPXRequest(connect_timeout=20, read_timeout=20)
     app = (
@@ -11,7 +11,7 @@ from core.progress.estimator import ProgressEstimator
 from core.progress.stages import HeartbeatManager, StageTracker
 from core.interfaces import ProgressPayload, StreamingResult
 from core.message import Message
-from ambient.session import session_manager
+from ambient.session import get_session_manager
 
 _logger = get_logger()
 
@@ -146,7 +146,7 @@ class LLMOrchestrator:
                     nonlocal output_buffer, reasoning_buffer, error_output, last_activity, last_edit_time
 
                     while True:
-                        if session_manager.is_cancelled(status_message.chat_id):
+                        if get_session_manager().is_cancelled(status_message.chat_id):
                             raise asyncio.CancelledError("User requested stop.")
 
                         try:
@@ -227,7 +227,7 @@ class LLMOrchestrator:
                     await process.wait()
                 except (asyncio.CancelledError, Exception) as e:
                     process.terminate()
-                    session_manager.unmark_cancelled(status_message.chat_id)
+                    get_session_manager().unmark_cancelled(status_message.chat_id)
                     if isinstance(e, asyncio.CancelledError):
                         _logger.info(f"Compression cancelled for chat {status_message.chat_id}")
                     raise
@@ -281,8 +281,8 @@ class StreamOrchestrator:
             assistant = manager.get_default_assistant()
 
         chat_id = status_message.chat_id
-        if session_manager.is_cancelled(chat_id):
-            session_manager.unmark_cancelled(chat_id)
+        if get_session_manager().is_cancelled(chat_id):
+            get_session_manager().unmark_cancelled(chat_id)
 
         _logger.log_stage_start(ProcessingStage.INVOKING_ASSISTANT, agent=agent, assistant=assistant.name)
 
@@ -340,7 +340,7 @@ class StreamOrchestrator:
                     nonlocal token_count, last_edit_time
 
                     while True:
-                        if session_manager.is_cancelled(chat_id):
+                        if get_session_manager().is_cancelled(chat_id):
                             raise asyncio.CancelledError("User requested stop.")
 
                         try:
@@ -492,11 +492,11 @@ class StreamOrchestrator:
                 except asyncio.CancelledError:
                     _logger.info(f"Streaming for chat {chat_id} was cancelled.")
                     process.terminate()
-                    session_manager.unmark_cancelled(chat_id)
+                    get_session_manager().unmark_cancelled(chat_id)
                     raise
                 except Exception:
                     process.terminate()
-                    session_manager.unmark_cancelled(chat_id)
+                    get_session_manager().unmark_cancelled(chat_id)
                     raise
                 finally:
                     timer_task.cancel()
@@ -541,8 +541,8 @@ class StreamOrchestrator:
                 metadata: Dict[str, Any] = {}
 
                 if question:
-                    state = session_manager.get_or_create_session(chat_id)
-                    session_manager.set_pending_question(state.session_id, question)
+                    state = get_session_manager().get_or_create_session(chat_id)
+                    get_session_manager().set_pending_question(state.session_id, question)
                     metadata["question"] = question
 
                 model_provider = getattr(assistant, "get_model", lambda: "")
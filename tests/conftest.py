@@ -0,0 +1,5 @@
+import os
+import sys
+
+# Make the packages under src/ importable for every test module.
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
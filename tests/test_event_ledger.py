@@ -0,0 +1,59 @@
+import asyncio
+import json
+
+from core.events import SessionID
+from core.telemetry import EventLedger
+
+
+def _run(coro):
+    return asyncio.run(coro)
+
+
+class TestBatchedWrites:
+    def test_flushed_events_are_readable_in_order(self, tmp_path):
+        ledger = EventLedger(tmp_path / "event-ledger.jsonl")
+
+        async def scenario():
+            for i in range(5):
+                await ledger.log_event(SessionID(1), "Step", {"i": i})
+            await ledger.log_event(SessionID(2), "Other")
+            await ledger.flush()
+            return ledger.get_events(SessionID(1))
+
+        events = _run(scenario())
+        assert [event.payload["i"] for event in events] == [0, 1, 2, 3, 4]
+        assert [event.event_type for event in ledger.get_events(SessionID(2))] == ["Other"]
+
+    def test_close_writes_pending_events_and_stops_writer(self, tmp_path):
+        ledger = EventLedger(tmp_path / "event-ledger.jsonl")
+
+        async def scenario():
+            for i in range(3):
+                await ledger.log_event(SessionID(1), "Step", {"i": i})
+            task = ledger._writer_task
+            await ledger.close()
+            return task
+
+        task = _run(scenario())
+        assert task.done()
+        assert ledger._writer_task is None
+        assert len(ledger.get_events(SessionID(1))) == 3
+
+
+class TestIndex:
+    def test_lines_written_before_the_index_are_found(self, tmp_path):
+        path = tmp_path / "event-ledger.jsonl"
+        path.write_text("".join(
+            json.dumps({"session_id": 1, "event_type": "Old", "timestamp": 0.0, "payload": {"i": i}}) + "\n"
+            for i in range(3)
+        ))
+        ledger = EventLedger(path)
+
+        async def scenario():
+            await ledger.log_event(SessionID(2), "New")
+            await ledger.close()
+
+        _run(scenario())
+        assert [event.payload["i"] for event in ledger.get_events(SessionID(1))] == [0, 1, 2]
+        assert len(EventLedger(path).get_events(SessionID(1))) == 3
+        assert len(EventLedger(path).get_events(SessionID(2))) == 1
@@ -0,0 +1,135 @@
+import json
+
+import pytest
+
+import ambient.session as session_module
+import core.telemetry as telemetry
+from ambient.session import SessionManager
+from core.telemetry import EventLedger
+
+
+@pytest.fixture
+def state_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(session_module, "SESSION_STATE_PATH", tmp_path / "sessions-state.json")
+    monkeypatch.setattr(session_module, "SESSION_PAYLOAD_DIR", tmp_path / "sessions")
+    monkeypatch.setattr(session_module, "SESSION_LOG_PATH", tmp_path / "sessions-log.jsonl")
+    monkeypatch.setattr(telemetry, "_ledger", EventLedger(tmp_path / "event-ledger.jsonl"))
+    return tmp_path
+
+
+def _log_lines(state_dir):
+    path = state_dir / "sessions-log.jsonl"
+    return path.read_bytes().splitlines() if path.exists() else []
+
+
+class TestLogCompaction:
+    def test_log_from_previous_run_is_folded_on_start(self, state_dir):
+        for run in range(3):
+            manager = SessionManager()
+            for i in range(10):
+                manager.add_message(1, "user", f"message {run}-{i}")
+            # Only this run's ops remain; earlier runs were folded at startup.
+            assert len(_log_lines(state_dir)) == 10
+
+        manager = SessionManager()
+        assert not _log_lines(state_dir)
+        payload = json.loads((state_dir / "sessions" / "1.json").read_bytes())
+        assert len(payload["history"]) == 30
+        assert len(manager.get_conversation_window(1)) == 30
+
+
+class TestLegacyMigration:
+    def test_full_state_file_is_split_into_index_and_payload(self, state_dir):
+        legacy = {
+            "1": {
+                "session_id": 1,
+                "chat_id": 42,
+                "created_at": "2024-01-01T00:00:00",
+                "last_active": "2024-01-01T00:05:00",
+                "window_start": 1,
+                "history": [
+                    {"role": "user", "content": "hi", "solo": False},
+                    {"role": "assistant", "content": "hello", "solo": True},
+                ],
+                "context_envelope": {"summary_text": "greeting"},
+                "working_set": ["a.py"],
+                "cancelled": True,
+            }
+        }
+        (state_dir / "sessions-state.json").write_text(json.dumps(legacy))
+
+        SessionManager()
+
+        index = json.loads((state_dir / "sessions-state.json").read_bytes())
+        assert "history" not in index["1"]
+        assert index["1"]["chat_id"] == 42
+        payload = json.loads((state_dir / "sessions" / "1.json").read_bytes())
+        assert payload["history"] == legacy["1"]["history"]
+        assert payload["working_set"] == ["a.py"]
+
+        restarted = SessionManager()
+        assert restarted.is_cancelled(42) is True
+        assert restarted.get_conversation_window(42) == legacy["1"]["history"][1:]
+        assert restarted.context_summary_for_prompt(1) == "greeting"
+
+
+class TestLogReplay:
+    def test_restart_replays_logged_ops(self, state_dir):
+        manager = SessionManager()
+        manager.add_message(7, "user", "first")
+        manager.add_message(7, "assistant", "second", solo=True)
+        manager.advance_window(7)
+        manager.add_message(7, "user", "third")
+        manager.cancel_session(7)
+        assert len(_log_lines(state_dir)) == 5
+
+        restarted = SessionManager()
+        assert restarted.is_cancelled(7) is True
+        assert restarted.get_conversation_window(7) == [
+            {"role": "user", "content": "third", "solo": False},
+        ]
+        assert restarted.get_or_create_session(7).history_length == 3
+
+    def test_restart_replays_clear(self, state_dir):
+        manager = SessionManager()
+        manager.add_message(7, "user", "before")
+        manager.cancel_session(7)
+        manager.clear_conversation(7)
+        manager.add_message(7, "user", "after")
+
+        restarted = SessionManager()
+        assert restarted.is_cancelled(7) is False
+        assert restarted.get_conversation_window(7) == [
+            {"role": "user", "content": "after", "solo": False},
+        ]
+
+    def test_log_already_in_snapshot_is_not_applied_twice(self, state_dir):
+        manager = SessionManager()
+        manager.add_message(7, "user", "one")
+        manager.add_message(7, "assistant", "two")
+        log_bytes = (state_dir / "sessions-log.jsonl").read_bytes()
+        manager._save_session_states()
+        # A crash between writing the snapshot and removing the log.
+        (state_dir / "sessions-log.jsonl").write_bytes(log_bytes)
+
+        restarted = SessionManager()
+        assert [m["content"] for m in restarted.get_conversation_window(7)] == ["one", "two"]
+
+
+class TestLazyPayload:
+    def test_header_lookups_do_not_load_payload(self, state_dir):
+        manager = SessionManager()
+        manager.add_message(7, "user", "hello")
+        manager.set_pending_question(1, "which file?")
+        manager._save_session_states()
+
+        restarted = SessionManager()
+        state = restarted.sessions[1]
+        assert state._loaded is False
+        assert restarted.get_pending_question(7) == "which file?"
+        assert restarted.is_cancelled(7) is False
+        assert restarted.check_loop_detected(7) is False
+        assert state._loaded is False
+
+        assert restarted.get_conversation_window(7)[0]["content"] == "hello"
+        assert state._loaded is True
@@ -1,8 +1,5 @@
+import re
 import pytest
-import sys
-import os
-
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 from ambient.telegram.utils import (
     is_within_limit,
@@ -15,6 +12,50 @@ from ambient.telegram.utils import (
 )
 
 
+_NUM_RE = re.compile(r'\[\d+/\d+\]')
+
+_PARAGRAPH_RE = re.compile(r'Paragraph [123]')
+
+_LINES_TEXT = "\n".join(f"line {i}" for i in range(100))
+
+
+# Large inputs are built once per session and shared across tests.
+@pytest.fixture(scope="session")
+def at_limit_text():
+    return "a" * TELEGRAM_SAFE_MESSAGE_LENGTH
+
+
+@pytest.fixture(scope="session")
+def over_limit_text():
+    return "a" * (TELEGRAM_SAFE_MESSAGE_LENGTH + 100)
+
+
+@pytest.fixture(scope="session")
+def text_10k():
+    return "a" * 10000
+
+
+@pytest.fixture(scope="session")
+def text_20k():
+    return "a" * 20000
+
+
+@pytest.fixture(scope="session")
+def unicode_text():
+    return "Hello 🌍 " * 1000
+
+
+# Split results shared by tests that only inspect them.
+@pytest.fixture(scope="module")
+def chunks_10k(text_10k):
+    return split_message(text_10k)
+
+
+@pytest.fixture(scope="module")
+def chunks_20k(text_20k):
+    return split_message(text_20k)
+
+
 class TestIsWithinLimit:
     def test_short_message_within_limit(self):
         assert is_within_limit("Hello, world!") is True
@@ -30,6 +71,10 @@ class TestIsWithinLimit:
     def test_empty_message(self):
         assert is_within_limit("") is True
 
+    def test_astral_characters_count_as_two_units(self):
+        assert is_within_limit("🌍" * 2000, 4000) is True
+        assert is_within_limit("🌍" * 2001, 4000) is False
+
 
 class TestFindSplitPoint:
     def test_split_at_newline(self):
@@ -60,31 +105,26 @@ class TestSplitMessage:
         assert len(chunks) == 1
         assert chunks[0] == text
 
-    def test_message_at_limit(self):
-        text = "a" * TELEGRAM_SAFE_MESSAGE_LENGTH
-        chunks = split_message(text)
+    def test_message_at_limit(self, at_limit_text):
+        chunks = split_message(at_limit_text)
         assert len(chunks) == 1
         assert len(chunks[0]) <= TELEGRAM_SAFE_MESSAGE_LENGTH
 
-    def test_message_slightly_over_limit(self):
-        text = "a" * (TELEGRAM_SAFE_MESSAGE_LENGTH + 100)
-        chunks = split_message(text)
+    def test_message_slightly_over_limit(self, over_limit_text):
+        chunks = split_message(over_limit_text)
         assert len(chunks) == 2
-        assert all(len(c) <= TELEGRAM_SAFE_MESSAGE_LENGTH for c in chunks)
+        assert max(map(len, chunks), default=0) <= TELEGRAM_SAFE_MESSAGE_LENGTH
 
-    def test_very_long_message_multi_way_split(self):
-        text = "a" * 20000
-        chunks = split_message(text)
-        assert len(chunks) > 1
-        assert all(len(c) <= TELEGRAM_SAFE_MESSAGE_LENGTH for c in chunks)
+    def test_very_long_message_splits_multiple_ways(self, chunks_20k):
+        assert len(chunks_20k) > 1
+
+    def test_very_long_message_chunks_within_limit(self, chunks_20k):
+        assert max(map(len, chunks_20k), default=0) <= TELEGRAM_SAFE_MESSAGE_LENGTH
 
     def test_split_at_line_boundaries(self):
-        lines = ["line " + str(i) for i in range(100)]
-        text = "\n".join(lines)
-        chunks = split_message(text, max_length=200)
+        chunks = split_message(_LINES_TEXT, max_length=200)
         assert len(chunks) > 1
-        for chunk in chunks:
-            assert len(chunk) <= 200
+        assert max(map(len, chunks), default=0) <= 200
 
     def test_single_character_over_limit(self):
         text = "a" * (TELEGRAM_SAFE_MESSAGE_LENGTH + 1)
@@ -94,11 +134,21 @@ class TestSplitMessage:
     def test_empty_message_returns_empty_list(self):
         assert split_message("") == []
 
-    def test_numbering_added(self):
-        text = "a" * 10000
-        chunks = split_message(text)
-        assert len(chunks) > 1
-        assert any(f"[{i}/" in c for i, c in enumerate(chunks, 1))
+    def test_numbering_added(self, chunks_10k):
+        assert len(chunks_10k) > 1
+        assert any(_NUM_RE.search(c) for c in chunks_10k)
+
+    def test_numbering_with_double_digit_total_stays_within_limit(self):
+        text = "a" * 3000
+        chunks = split_message(text, max_length=200)
+        assert len(chunks) >= 10
+        assert chunks[0].endswith(f" [1/{len(chunks)}]")
+        assert max(map(len, chunks), default=0) <= 200
+
+    def test_repeated_split_returns_independent_lists(self, text_10k):
+        first = split_message(text_10k)
+        first.append("mutated")
+        assert split_message(text_10k) == first[:-1]
 
     def test_no_numbering_when_within_limit(self):
         text = "Short message"
@@ -147,25 +197,26 @@ class TestEdgeCases:
         chunks = split_message("   \n\n   ")
         assert len(chunks) == 1
 
-    def test_very_long_single_word(self):
-        text = "a" * 10000
-        chunks = split_message(text)
-        assert all(len(c) <= TELEGRAM_SAFE_MESSAGE_LENGTH for c in chunks)
+    def test_very_long_single_word(self, chunks_10k):
+        assert max(map(len, chunks_10k), default=0) <= TELEGRAM_SAFE_MESSAGE_LENGTH
 
-    def test_message_with_unicode(self):
-        text = "Hello 🌍 " * 1000
-        chunks = split_message(text)
-        assert all(len(c) <= TELEGRAM_SAFE_MESSAGE_LENGTH for c in chunks)
+    def test_message_with_unicode(self, unicode_text):
+        chunks = split_message(unicode_text)
+        assert max(map(len, chunks), default=0) <= TELEGRAM_SAFE_MESSAGE_LENGTH
         assert len(chunks) > 1
 
+    def test_unicode_chunks_fit_in_utf16_units(self):
+        text = "🌍" * 5000
+        chunks = split_message(text)
+        assert len(chunks) > 2
+        assert all(len(c.encode("utf-16-le")) // 2 <= TELEGRAM_SAFE_MESSAGE_LENGTH for c in chunks)
+
     def test_preserves_paragraphs(self):
         text = "Paragraph 1\n\nParagraph 2\n\nParagraph 3"
         chunks = split_message(text, max_length=20)
         assert len(chunks) > 0
         combined = " ".join(chunks)
-        assert "Paragraph 1" in combined
-        assert "Paragraph 2" in combined
-        assert "Paragraph 3" in combined
+        assert set(_PARAGRAPH_RE.findall(combined)) == {"Paragraph 1", "Paragraph 2", "Paragraph 3"}
 
 
 if __name__ == "__main__":